@@ -4,12 +4,58 @@ Business Intelligence Analyzer Module - Simplified Version
 """
 import logging
 import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized analyze_question results (LRU eviction)
+RESPONSE_CACHE_SIZE = 4096
+
+# Question terms and the strategic area each one maps to, in report order
+KEYWORD_MAP = {
+    "market": "Market Analysis",
+    "growth": "Growth Strategy",
+    "competition": "Competitive Analysis",
+    "revenue": "Revenue Optimization",
+    "customer": "Customer Strategy",
+    "digital": "Digital Transformation",
+    "innovation": "Innovation Strategy",
+    "cost": "Cost Management",
+    "risk": "Risk Assessment",
+    "opportunity": "Market Opportunities"
+}
+
+# Reported when the question mentions none of the mapped terms
+DEFAULT_KEYWORDS = ("Strategic Analysis", "Business Opportunities", "Growth Potential")
+
+def _build_insight(keyword):
+    """Build the (titles, insights) pair reported for a strategic keyword"""
+    titles = (
+        f"{keyword} Assessment",
+        "Implementation Strategy",
+        "Success Metrics"
+    )
+    insights = (
+        f"Strategic analysis of {keyword.lower()} reveals significant opportunities for growth and competitive advantage.",
+        "Implementation requires focused approach with clear timelines and measurable objectives.",
+        "Success metrics should include both quantitative KPIs and qualitative improvements in market position."
+    )
+    return titles, insights
+
+# The keyword set is fixed, so every insight block is built once at import.
+# Stored immutably; responses get fresh lists (see BusinessAnalyzer._build_result).
+_INSIGHT_TEMPLATES = MappingProxyType({
+    keyword: _build_insight(keyword)
+    for keyword in (*KEYWORD_MAP.values(), *DEFAULT_KEYWORDS)
+})
+
 class BusinessAnalyzer:
-    def __init__(self):
-        self._response_cache = {}
+    def __init__(self, cache_size=RESPONSE_CACHE_SIZE):
+        self._response_cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
         
     def analyze_question(self, question, custom_keywords=""):
         """Analyze a business question and return structured insights"""
@@ -17,64 +63,62 @@ class BusinessAnalyzer:
             if not question or not question.strip():
                 return {"error": "Question cannot be empty", "keywords": [], "insights": {}}
 
+            # Results are deterministic per input, so serve repeats from cache.
+            # Keyed on a fixed-size digest so entries don't pin the request strings.
+            cache_key = hashlib.blake2b(f"{question}\0{custom_keywords}".encode(), digest_size=16).digest()
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return self._build_result(*cached)
+
             # Generate analysis based on question content
-            analysis_id = hashlib.md5(f"{question}_{custom_keywords}".encode()).hexdigest()[:8]
+            analysis_id = hashlib.blake2b(f"{question}_{custom_keywords}".encode(), digest_size=4).hexdigest()
             
             # Basic keyword extraction from question
             question_lower = question.lower()
-            detected_keywords = []
-            
-            keyword_map = {
-                "market": "Market Analysis",
-                "growth": "Growth Strategy", 
-                "competition": "Competitive Analysis",
-                "revenue": "Revenue Optimization",
-                "customer": "Customer Strategy",
-                "digital": "Digital Transformation",
-                "innovation": "Innovation Strategy",
-                "cost": "Cost Management",
-                "risk": "Risk Assessment",
-                "opportunity": "Market Opportunities"
-            }
-            
-            for word, keyword in keyword_map.items():
-                if word in question_lower:
-                    detected_keywords.append(keyword)
+            detected_keywords = [keyword for word, keyword in KEYWORD_MAP.items() if word in question_lower]
             
             # Default keywords if none detected
             if not detected_keywords:
-                detected_keywords = ["Strategic Analysis", "Business Opportunities", "Growth Potential"]
-            
-            # Limit to 5 keywords
-            detected_keywords = detected_keywords[:5]
+                detected_keywords = DEFAULT_KEYWORDS
             
-            # Generate insights
-            insights = {}
-            for i, keyword in enumerate(detected_keywords):
-                insights[keyword] = {
-                    "titles": [
-                        f"{keyword} Assessment",
-                        f"Implementation Strategy", 
-                        f"Success Metrics"
-                    ],
-                    "insights": [
-                        f"Strategic analysis of {keyword.lower()} reveals significant opportunities for growth and competitive advantage.",
-                        f"Implementation requires focused approach with clear timelines and measurable objectives.",
-                        f"Success metrics should include both quantitative KPIs and qualitative improvements in market position."
-                    ]
-                }
-            
-            return {
-                "keywords": detected_keywords,
-                "insights": insights,
-                "analysis_id": analysis_id,
-                "error": None
-            }
+            # Limit to 5 keywords; cache an immutable entry, hand callers fresh containers
+            entry = (analysis_id, tuple(detected_keywords[:5]))
+            self._set_cached(cache_key, entry)
+            return self._build_result(*entry)
 
         except Exception as e:
             logger.error(f"Error in analyze_question: {str(e)}")
             return {"error": f"Analysis failed: {str(e)}", "keywords": [], "insights": {}}
 
+    def _build_result(self, analysis_id, keywords):
+        """Build a response from a cache entry without exposing shared containers"""
+        insights = {}
+        for keyword in keywords:
+            titles, texts = _INSIGHT_TEMPLATES[keyword]
+            insights[keyword] = {"titles": list(titles), "insights": list(texts)}
+        return {
+            "keywords": list(keywords),
+            "insights": insights,
+            "analysis_id": analysis_id,
+            "error": None
+        }
+
+    def _get_cached(self, key):
+        """Return a cached entry and mark it most recently used"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                self._response_cache.move_to_end(key)
+            return entry
+
+    def _set_cached(self, key, entry):
+        """Store an entry, evicting the least recently used one when full"""
+        with self._cache_lock:
+            self._response_cache[key] = entry
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self._cache_size:
+                self._response_cache.popitem(last=False)
+
     def analyze_text(self, text, question=None, keywords=None):
         """Analyze text content"""
         if not text:
@@ -4,17 +4,33 @@ Integrates with main Flask app
 """
 import os
 import hashlib
+import mimetypes
+from collections import Counter
 from datetime import datetime, timedelta
-import pandas as pd
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Read size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+ALLOWED_EXTENSIONS = frozenset({'.pdf', '.docx', '.txt', '.png', '.jpg', '.jpeg'})
+
+# Explicit types for the allowed extensions; anything else goes through mimetypes
+_MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.txt': 'text/plain',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg'
+}
+
 class LegalDocManager:
     def __init__(self, upload_folder="uploads/legal_docs"):
         self.upload_folder = upload_folder
-        self.allowed_extensions = {'.pdf', '.docx', '.txt', '.png', '.jpg', '.jpeg'}
+        self.allowed_extensions = ALLOWED_EXTENSIONS
         os.makedirs(upload_folder, exist_ok=True)
         
     def upload_document(self, file, client_name, matter_description, user_email):
@@ -24,15 +40,16 @@ class LegalDocManager:
                 return {"error": "File type not allowed"}
             
             # Generate unique filename
-            file_hash = hashlib.md5(f"{file.filename}_{datetime.now().isoformat()}".encode()).hexdigest()[:8]
+            file_hash = hashlib.blake2b(f"{file.filename}_{datetime.now().isoformat()}".encode(), digest_size=4).hexdigest()
             filename = f"{file_hash}_{file.filename}"
             filepath = os.path.join(self.upload_folder, filename)
             
-            # Save file
-            file.save(filepath)
-            
-            # Get file size
-            file_size = os.path.getsize(filepath)
+            # Save file, counting its size in the same pass
+            file_size = 0
+            with open(filepath, 'wb') as out:
+                for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                    out.write(chunk)
+                    file_size += len(chunk)
             file_size_str = self._format_file_size(file_size)
             
             # Determine document type
@@ -66,19 +83,20 @@ class LegalDocManager:
             # For now, return mock data based on filters
             documents = self._get_mock_documents()
             
-            # Apply filters
-            if client_filter and client_filter != "All":
-                documents = [doc for doc in documents if doc['client'] == client_filter]
-            
-            if type_filter and type_filter != "All":
-                documents = [doc for doc in documents if doc['type'] == type_filter]
-            
-            if search_term:
-                search_lower = search_term.lower()
-                documents = [doc for doc in documents if 
-                           search_lower in doc['original_name'].lower() or 
-                           search_lower in doc['client'].lower() or
-                           search_lower in doc['matter'].lower()]
+            # Apply all filters in a single pass, cheapest equality checks first
+            if client_filter == "All":
+                client_filter = None
+            if type_filter == "All":
+                type_filter = None
+            search_lower = search_term.lower() if search_term else None
+            
+            documents = [
+                doc for doc in documents
+                if (not client_filter or doc['client'] == client_filter)
+                and (not type_filter or doc['type'] == type_filter)
+                and (not search_lower or any(search_lower in doc[field].lower()
+                                             for field in ('original_name', 'client', 'matter')))
+            ]
             
             return {"success": True, "documents": documents}
             
@@ -87,7 +105,7 @@ class LegalDocManager:
             return {"error": f"Failed to retrieve documents: {str(e)}"}
     
     def get_document_content(self, document_id):
-        """Get document content for viewing/downloading"""
+        """Locate a document's file for viewing/downloading"""
         try:
             # In production, find document by ID in database
             document = self._find_document_by_id(document_id)
@@ -98,12 +116,11 @@ class LegalDocManager:
             if not filepath or not os.path.exists(filepath):
                 return {"error": "Document file not found"}
             
-            with open(filepath, 'rb') as f:
-                content = f.read()
-            
+            # Return the path rather than the bytes; send_file(filepath, conditional=True)
+            # streams it and derives ETag/Last-Modified/Range handling from the file itself
             return {
                 "success": True, 
-                "content": content, 
+                "filepath": filepath, 
                 "filename": document['original_name'],
                 "mime_type": self._get_mime_type(document['original_name'])
             }
@@ -242,11 +259,8 @@ class LegalDocManager:
             time_entries = self._get_mock_time_entries()
             
             # Document statistics
-            doc_types = {}
-            client_docs = {}
-            for doc in documents:
-                doc_types[doc['type']] = doc_types.get(doc['type'], 0) + 1
-                client_docs[doc['client']] = client_docs.get(doc['client'], 0) + 1
+            doc_types = dict(Counter(doc['type'] for doc in documents))
+            client_docs = dict(Counter(doc['client'] for doc in documents))
             
             # Time tracking statistics
             total_hours = sum(entry['hours'] for entry in time_entries)
@@ -305,15 +319,7 @@ class LegalDocManager:
     def _get_mime_type(self, filename):
         """Get MIME type for file"""
         ext = os.path.splitext(filename)[1].lower()
-        mime_types = {
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.txt': 'text/plain',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg'
-        }
-        return mime_types.get(ext, 'application/octet-stream')
+        return _MIME_TYPES.get(ext) or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
     
     def _get_mock_documents(self):
         """Mock document data - replace with database query in production"""